@@ -4,53 +4,468 @@ Advanced Random Value Generator
 Generates random values with various patterns and exclusions
 """
 
+import functools
+import math
+import os
 import random
 import string
-import argparse
 import sys
-from typing import List, Optional, Set
+from typing import ClassVar, Dict, List, Optional, Set
 import re
+
+GUI_AVAILABLE = None  # resolved lazily on first GUI use
+
+
+def _import_tkinter() -> bool:
+    """Import tkinter on demand so CLI/TUI runs never pay its startup cost"""
+    global tk, ttk, scrolledtext, messagebox, GUI_AVAILABLE
+    if GUI_AVAILABLE is None:
+        try:
+            import tkinter as tk
+            from tkinter import ttk, scrolledtext, messagebox
+            GUI_AVAILABLE = True
+        except ImportError:
+            GUI_AVAILABLE = False
+    return GUI_AVAILABLE
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 try:
-    import tkinter as tk
-    from tkinter import ttk, scrolledtext, messagebox
-    import math
-    GUI_AVAILABLE = True
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
 except ImportError:
-    GUI_AVAILABLE = False
+    NUMBA_AVAILABLE = False
+
+# string-module constants cached at import so hot paths skip the module
+# attribute lookups
+_ASCII_LETTERS = string.ascii_letters
+_ASCII_LOWERCASE = string.ascii_lowercase
+_ASCII_UPPERCASE = string.ascii_uppercase
+_DIGITS = string.digits
+_PUNCTUATION = string.punctuation
+_HEX_DIGITS = "0123456789abcdef"
+
+if NUMPY_AVAILABLE:
+    # 256 two-character hex codes as a (256, 2) byte table: one gather
+    # hex-encodes a whole RGB buffer without per-color formatting
+    _HEX_LUT = np.frombuffer(
+        ''.join(f'{i:02x}' for i in range(256)).encode('ascii'),
+        dtype=np.uint8).reshape(256, 2)
+
+if NUMPY_AVAILABLE and NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _fill_string_kernel(table, count, length, seed):
+        """Compiled index-gather for very large generate_string batches"""
+        np.random.seed(seed)
+        n = table.shape[0]
+        total = count * length
+        out = np.empty(total, np.uint8)
+        for i in range(total):
+            out[i] = table[np.random.randint(0, n)]
+        return out
+
+    @njit(cache=True)
+    def _reject_numbers_kernel(lo, hi, excl, count, seed):
+        """Compiled unique-draw rejection loop for generate_number.
+
+        excl must be sorted; membership is a binary search. Uniqueness is
+        tracked in an open-addressing table since compiled code cannot use
+        a Python set.
+        """
+        np.random.seed(seed)
+        out = np.empty(count, np.int64)
+        # power-of-two capacity, at most half full
+        cap = 2
+        while cap < 2 * count:
+            cap <<= 1
+        mask = cap - 1
+        used = np.zeros(cap, np.bool_)
+        keys = np.empty(cap, np.int64)
+        n = 0
+        while n < count:
+            x = np.random.randint(lo, hi + 1)
+            j = np.searchsorted(excl, x)
+            if j < excl.shape[0] and excl[j] == x:
+                continue
+            h = (np.uint64(x) * np.uint64(0x9E3779B97F4A7C15)) >> np.uint64(40)
+            slot = np.int64(h) & mask
+            dup = False
+            while used[slot]:
+                if keys[slot] == x:
+                    dup = True
+                    break
+                slot = (slot + 1) & mask
+            if dup:
+                continue
+            used[slot] = True
+            keys[slot] = x
+            out[n] = x
+            n += 1
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _fill_floats_kernel(lo, hi, count, chunk, seed):
+        """Parallel uniform fill for very large generate_float batches.
+
+        Each prange chunk seeds its own thread state from (seed + chunk
+        index) and fills its own slice, so output is deterministic no
+        matter how chunks land on threads.
+        """
+        out = np.empty(count, np.float64)
+        for c in prange((count + chunk - 1) // chunk):
+            np.random.seed(seed + c)
+            start = c * chunk
+            end = min(start + chunk, count)
+            for i in range(start, end):
+                out[i] = np.random.uniform(lo, hi)
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _rgb_to_hsl_kernel(rgb):
+        """Compiled batch version of RandomGenerator._rgb_to_hsl"""
+        n = rgb.shape[0]
+        out = np.empty((n, 3), np.int64)
+        for i in prange(n):
+            r = rgb[i, 0] / 255.0
+            g = rgb[i, 1] / 255.0
+            b = rgb[i, 2] / 255.0
+            max_c = max(r, g, b)
+            min_c = min(r, g, b)
+            l = (max_c + min_c) / 2.0
+
+            if max_c == min_c:
+                h = s = 0.0
+            else:
+                d = max_c - min_c
+                s = d / (2.0 - max_c - min_c) if l > 0.5 else d / (max_c + min_c)
+
+                if max_c == r:
+                    h = (g - b) / d + (6.0 if g < b else 0.0)
+                elif max_c == g:
+                    h = (b - r) / d + 2.0
+                else:
+                    h = (r - g) / d + 4.0
+                h /= 6.0
+
+            out[i, 0] = int(h * 360)
+            out[i, 1] = int(s * 100)
+            out[i, 2] = int(l * 100)
+        return out
+
+
+class _AliasTable:
+    """Walker/Vose alias table for O(1) weighted sampling"""
+
+    def __init__(self, weights: List[float]):
+        n = len(weights)
+        total = sum(weights)
+        if any(w < 0 for w in weights) or total <= 0:
+            raise ValueError("Weights must be non-negative and sum to a positive value")
+
+        scaled = [w * n / total for w in weights]
+        self.n = n
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+
+        small = [i for i, w in enumerate(scaled) if w < 1.0]
+        large = [i for i, w in enumerate(scaled) if w >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] += scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def draw(self, rng: random.Random = random) -> int:
+        """Draw one weighted index: one uniform index plus one coin flip"""
+        i = rng.randrange(self.n)
+        return i if rng.random() < self.prob[i] else self.alias[i]
 
 
 class RandomGenerator:
     """Generate various types of random values"""
 
-    def __init__(self):
+    _TEMPLATE_RE = re.compile(r'\{([dluaxsw])\}')
+
+    # Minimum count before the NumPy batch paths pay for themselves;
+    # below this the scalar stdlib paths are faster
+    _BATCH_THRESHOLD = 16
+
+    # Character sets, built once at import instead of per call
+    _PATTERNS: ClassVar[Dict[str, str]] = {
+        "alphanumeric": _ASCII_LETTERS + _DIGITS,
+        "alpha": _ASCII_LETTERS,
+        "numeric": _DIGITS,
+        "lowercase": _ASCII_LOWERCASE,
+        "uppercase": _ASCII_UPPERCASE,
+        "hex": _HEX_DIGITS,
+        "symbols": _PUNCTUATION,
+        "alphanumeric_symbols": _ASCII_LETTERS + _DIGITS + _PUNCTUATION
+    }
+
+    # Tuples rather than strings: random.choice/choices index the
+    # population per draw, and tuple indexing hands back the cached
+    # one-char objects instead of building a new string each time
+    _REPLACEMENTS: ClassVar[Dict[str, tuple]] = {
+        'd': tuple(_DIGITS),
+        'l': tuple(_ASCII_LOWERCASE),
+        'u': tuple(_ASCII_UPPERCASE),
+        'a': tuple(_ASCII_LETTERS),
+        'x': tuple(_HEX_DIGITS),
+        's': tuple(_PUNCTUATION),
+        'w': tuple(_ASCII_LETTERS + _DIGITS)
+    }
+
+    # Process-wide generator shared by unseeded instances, created on
+    # first use; seeded instances always get their own stream
+    _shared_rng = None
+
+    def __init__(self, seed: Optional[int] = None):
         self.hex_colors = True
+        self._pyrand = random.Random(seed)
+        if not NUMPY_AVAILABLE:
+            self._rng = None
+        elif seed is not None:
+            self._rng = self._make_rng(seed)
+        else:
+            if RandomGenerator._shared_rng is None:
+                RandomGenerator._shared_rng = self._make_rng(None)
+            self._rng = RandomGenerator._shared_rng
+        self._alias_tables = {}
+        self._translate_tables = {}
+        self._charset_arrays = {}
+
+    @staticmethod
+    def _make_rng(seed: Optional[int]):
+        """Build the bulk generator on the DXSM variant of PCG64.
+
+        Same statistical guarantees as default_rng's PCG64 but with a
+        cheaper output step, which adds up across the batched draws here.
+        """
+        return np.random.Generator(np.random.PCG64DXSM(seed))
+
+    def seed(self, value: Optional[int] = None) -> None:
+        """Seed both backing generators for reproducible output"""
+        self._pyrand.seed(value)
+        if NUMPY_AVAILABLE:
+            self._rng = self._make_rng(value)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile_template(template: str) -> tuple:
+        """Parse a template into (parts, kinds, slots, fills), cached.
+
+        Even indices of parts are literal text, odd indices placeholders;
+        fills holds each slot's resolved character set, so repeated calls
+        with the same template skip the parse and the lookups entirely.
+        """
+        parts = tuple(RandomGenerator._TEMPLATE_RE.split(template))
+        kinds = parts[1::2]
+        slots = tuple(range(1, len(parts), 2))
+        fills = tuple(RandomGenerator._REPLACEMENTS[k] for k in kinds)
+        return parts, kinds, slots, fills
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _charset_for(pattern: str, exclude_chars: str) -> str:
+        """Resolve the effective charset for a pattern/exclusion pair.
+
+        Cached so repeated calls with the same arguments skip the filtering.
+        """
+        charset = RandomGenerator._PATTERNS.get(
+            pattern, RandomGenerator._PATTERNS["alphanumeric"])
+        if exclude_chars:
+            # Deletion table runs the filter in one C loop
+            charset = charset.translate(str.maketrans('', '', exclude_chars))
+        return charset
+
+    def _charset_table(self, charset: str):
+        """uint8 view of a charset for NumPy gathers, cached per charset"""
+        table = self._charset_arrays.get(charset)
+        if table is None:
+            table = self._charset_arrays[charset] = np.frombuffer(
+                charset.encode('ascii'), dtype=np.uint8)
+        return table
+
+    def _randbytes(self, n: int) -> bytes:
+        """Bulk byte draw from the instance RNG (stays seedable, no syscall)"""
+        return self._pyrand.getrandbits(n * 8).to_bytes(n, 'little')
+
+    def _parallel_map(self, fn, count: int, chunk: int = 65536) -> List:
+        """Run fn(rng, n) over independent chunks on a thread pool.
+
+        NumPy generators release the GIL during bulk draws, so chunks run
+        in parallel; each worker gets its own spawned child generator to
+        keep the streams independent (and reproducible under a seed).
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        sizes = [chunk] * (count // chunk)
+        if count % chunk:
+            sizes.append(count % chunk)
+
+        results = []
+        with ThreadPoolExecutor() as pool:
+            for part in pool.map(fn, self._rng.spawn(len(sizes)), sizes):
+                results.extend(part)
+        return results
 
     def generate_number(self, min_val: int = 1, max_val: int = 100,
                        exclude: Optional[Set[int]] = None,
                        count: int = 1) -> List[int]:
         """Generate random numbers with exclusions"""
-        exclude = exclude or set()
+        # Normalize once: callers may hand us a list, and the rejection loop
+        # below does a membership test per candidate
+        exclude = frozenset(exclude) if exclude else frozenset()
+        range_size = max_val - min_val + 1
+
+        # No exclusions: random.sample works on the range object directly,
+        # so there is nothing to materialize at all
+        if not exclude:
+            if range_size < count:
+                raise ValueError(f"Not enough numbers available. Need {count}, have {range_size}")
+            if NUMPY_AVAILABLE and count >= self._BATCH_THRESHOLD:
+                # C-level Floyd sampling over the bare range; shuffle=False
+                # skips the permutation pass, so randomize order ourselves
+                picked = self._rng.choice(
+                    range_size, size=count, replace=False, shuffle=False)
+                self._rng.shuffle(picked)
+                return (picked + min_val).tolist()
+            return self._pyrand.sample(range(min_val, max_val + 1), count)
+
+        # When exclusions (and the requested count) are sparse relative to the
+        # range, draw with rejection sampling instead of materializing the
+        # full candidate list — O(count) work/memory instead of O(range)
+        if exclude and (len(exclude) + count) * 4 < range_size:
+            in_range = sum(1 for x in exclude if min_val <= x <= max_val)
+            if range_size - in_range < count:
+                raise ValueError(f"Not enough numbers available. Need {count}, have {range_size - in_range}")
+
+            # Large jobs run the whole reject-and-dedup loop compiled;
+            # draw order is already random, so no shuffle needed
+            if NUMPY_AVAILABLE and NUMBA_AVAILABLE and count >= 512:
+                excl_arr = np.fromiter(exclude, np.int64, len(exclude))
+                excl_arr.sort()
+                return _reject_numbers_kernel(
+                    min_val, max_val, excl_arr, count,
+                    self._pyrand.getrandbits(31)).tolist()
+
+            # Safety valve: with the sparsity gate above each round should
+            # nearly finish the job, so hitting the cap means something is
+            # pathological — drop to the dense path rather than spin
+            picked = set()
+            for _ in range(64):
+                if NUMPY_AVAILABLE and count > 1:
+                    # Draw candidates in bulk; sparse exclusions mean few
+                    # of them get rejected
+                    candidates = self._rng.integers(
+                        min_val, max_val + 1, size=2 * (count - len(picked))).tolist()
+                else:
+                    randint = self._pyrand.randint
+                    candidates = [randint(min_val, max_val)
+                                  for _ in range(2 * (count - len(picked)))]
+                for x in candidates:
+                    if x not in exclude and x not in picked:
+                        picked.add(x)
+                        if len(picked) == count:
+                            break
+                if len(picked) == count:
+                    results = list(picked)
+                    self._pyrand.shuffle(results)
+                    return results
+
+        # Dense, big exclusion sets over a modest range: a boolean mask
+        # turns per-candidate hashing into array indexing, and the whole
+        # path (mask, survivors, draw) runs vectorized
+        if NUMPY_AVAILABLE and range_size <= 1 << 20 and len(exclude) > 1024:
+            mask = np.zeros(range_size, dtype=bool)
+            idx = np.fromiter(exclude, np.int64, len(exclude)) - min_val
+            mask[idx[(idx >= 0) & (idx < range_size)]] = True
+            available = np.flatnonzero(~mask)
+            if available.size < count:
+                raise ValueError(f"Not enough numbers available. Need {count}, have {available.size}")
+            picked = self._rng.choice(
+                available.size, size=count, replace=False, shuffle=False)
+            self._rng.shuffle(picked)
+            return (available[picked] + min_val).tolist()
+
         available = [x for x in range(min_val, max_val + 1) if x not in exclude]
 
         if len(available) < count:
             raise ValueError(f"Not enough numbers available. Need {count}, have {len(available)}")
 
-        return random.sample(available, count)
+        return self._pyrand.sample(available, count)
 
     def generate_float(self, min_val: float = 0.0, max_val: float = 1.0,
                       decimals: int = 2, count: int = 1) -> List[float]:
         """Generate random floating point numbers"""
-        return [round(random.uniform(min_val, max_val), decimals) for _ in range(count)]
+        def _batch(rng, n):
+            arr = rng.uniform(min_val, max_val, size=n)
+            # round in place: no second count-sized temporary
+            np.round(arr, decimals, out=arr)
+            return arr.tolist()
+
+        if NUMPY_AVAILABLE and count >= 200_000:
+            if NUMBA_AVAILABLE:
+                arr = _fill_floats_kernel(min_val, max_val, count, 65536,
+                                          self._pyrand.getrandbits(31))
+                np.round(arr, decimals, out=arr)
+                return arr.tolist()
+            return self._parallel_map(_batch, count)
+        if NUMPY_AVAILABLE and count >= self._BATCH_THRESHOLD:
+            # One vectorized draw instead of count Python-level calls
+            return _batch(self._rng, count)
+        uniform = self._pyrand.uniform
+        return [round(uniform(min_val, max_val), decimals) for _ in range(count)]
 
     def generate_color(self, format_type: str = "hex", count: int = 1) -> List[str]:
         """Generate random colors in various formats"""
+        if NUMPY_AVAILABLE and count >= self._BATCH_THRESHOLD:
+            # One raw byte draw covers all channels; frombuffer is a view,
+            # not a copy
+            rgb = np.frombuffer(self._rng.bytes(3 * count),
+                                dtype=np.uint8).reshape(count, 3)
+
+            if format_type == "rgb":
+                return [f"rgb({r}, {g}, {b})" for r, g, b in rgb.tolist()]
+            if format_type == "hsl":
+                return ['hsl(%d, %d%%, %d%%)' % t
+                        for t in self._rgb_to_hsl_batch(rgb)]
+
+            # hex (default): gather two-char codes per channel and stamp the
+            # leading '#' into the same buffer, then slice fixed-width rows
+            out = np.empty((count, 7), dtype=np.uint8)
+            out[:, 0] = ord('#')
+            out[:, 1:] = _HEX_LUT[rgb].reshape(count, 6)
+            buf = out.tobytes().decode('ascii')
+            return [buf[i:i + 7] for i in range(0, 7 * count, 7)]
+
+        if count > 1:
+            # Stdlib batch path: one bulk byte draw covers every channel,
+            # and %-formatting beats f-strings in a tight loop
+            buf = self._randbytes(3 * count)
+            if format_type == "rgb":
+                return ['rgb(%d, %d, %d)' % (buf[i], buf[i + 1], buf[i + 2])
+                        for i in range(0, 3 * count, 3)]
+            if format_type == "hsl":
+                return ['hsl(%d, %d%%, %d%%)' % self._rgb_to_hsl(buf[i], buf[i + 1], buf[i + 2])
+                        for i in range(0, 3 * count, 3)]
+            hexbuf = buf.hex()
+            return ['#' + hexbuf[i:i + 6] for i in range(0, 6 * count, 6)]
+
         colors = []
         for _ in range(count):
-            r, g, b = random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)
+            r, g, b = (self._pyrand.randint(0, 255), self._pyrand.randint(0, 255),
+                       self._pyrand.randint(0, 255))
 
-            if format_type == "hex":
-                colors.append(f"#{r:02x}{g:02x}{b:02x}")
-            elif format_type == "rgb":
+            if format_type == "rgb":
                 colors.append(f"rgb({r}, {g}, {b})")
             elif format_type == "hsl":
                 h, s, l = self._rgb_to_hsl(r, g, b)
@@ -60,8 +475,15 @@ class RandomGenerator:
 
         return colors
 
-    def _rgb_to_hsl(self, r: int, g: int, b: int) -> tuple:
-        """Convert RGB to HSL"""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _rgb_to_hsl(r: int, g: int, b: int) -> tuple:
+        """Convert RGB to HSL.
+
+        Memoized: scalar callers tend to revisit the same few hundred
+        colors, and the cache lookup is cheaper than the branchy
+        conversion. Batch paths use _rgb_to_hsl_batch and skip this.
+        """
         r, g, b = r/255, g/255, b/255
         max_c = max(r, g, b)
         min_c = min(r, g, b)
@@ -83,6 +505,34 @@ class RandomGenerator:
 
         return int(h * 360), int(s * 100), int(l * 100)
 
+    def _rgb_to_hsl_batch(self, rgb) -> List[tuple]:
+        """Convert a (count, 3) RGB array to HSL tuples in one pass"""
+        if NUMBA_AVAILABLE:
+            return [tuple(row) for row in _rgb_to_hsl_kernel(rgb).tolist()]
+
+        arr = rgb / 255.0
+        r, g, b = arr[:, 0], arr[:, 1], arr[:, 2]
+        # Pairwise ufuncs run on contiguous columns; max(axis=1) pays the
+        # generic strided-reduction machinery and is an order slower here
+        max_c = np.maximum(np.maximum(r, g), b)
+        min_c = np.minimum(np.minimum(r, g), b)
+        l = (max_c + min_c) / 2
+        d = max_c - min_c
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            s = np.where(l > 0.5, d / (2 - max_c - min_c), d / (max_c + min_c))
+            h = np.where(max_c == r, (g - b) / d + np.where(g < b, 6.0, 0.0),
+                         np.where(max_c == g, (b - r) / d + 2.0,
+                                  (r - g) / d + 4.0)) / 6
+
+        gray = d == 0
+        h = np.where(gray, 0.0, h)
+        s = np.where(gray, 0.0, s)
+
+        return list(zip((h * 360).astype(int).tolist(),
+                        (s * 100).astype(int).tolist(),
+                        (l * 100).astype(int).tolist()))
+
     def generate_string(self, length: int = 10,
                        pattern: str = "alphanumeric",
                        exclude_chars: str = "",
@@ -90,29 +540,55 @@ class RandomGenerator:
         """Generate random strings with patterns"""
         results = []
 
-        # Define character sets
-        patterns = {
-            "alphanumeric": string.ascii_letters + string.digits,
-            "alpha": string.ascii_letters,
-            "numeric": string.digits,
-            "lowercase": string.ascii_lowercase,
-            "uppercase": string.ascii_uppercase,
-            "hex": "0123456789abcdef",
-            "symbols": string.punctuation,
-            "alphanumeric_symbols": string.ascii_letters + string.digits + string.punctuation
-        }
-
-        charset = patterns.get(pattern, string.ascii_letters + string.digits)
+        # Hex with no exclusions maps exactly onto raw bytes: one urandom
+        # call plus one hex() encode covers the whole batch
+        if pattern == "hex" and not exclude_chars and count * length >= 64:
+            total = count * length
+            raw = self._randbytes((total + 1) // 2).hex()
+            return [raw[i * length:(i + 1) * length] for i in range(count)]
 
-        # Remove excluded characters
-        if exclude_chars:
-            charset = ''.join(c for c in charset if c not in exclude_chars)
+        charset = self._charset_for(pattern, exclude_chars)
 
         if not charset:
             raise ValueError("No characters available after exclusions")
 
+        # Very large jobs drop into a compiled index-gather loop when Numba
+        # is installed; seeding from the instance RNG keeps runs reproducible
+        if NUMPY_AVAILABLE and NUMBA_AVAILABLE and count * length >= 100_000:
+            table = self._charset_table(charset)
+            flat = _fill_string_kernel(
+                table, count, length, self._pyrand.getrandbits(31))
+            flat = flat.tobytes().decode('ascii')
+            return [flat[i * length:(i + 1) * length] for i in range(count)]
+
+        # Power-of-two charsets (e.g. hex) can be filled from one bulk byte
+        # draw: a 256-entry translation table maps every possible byte value
+        # onto the charset uniformly, so the whole batch is built in C
+        n = len(charset)
+        if count * length >= 64 and (n & (n - 1)) == 0 and n <= 256:
+            # Tables are cached per charset so repeat invocations with the
+            # same pattern/exclusions skip the setup entirely
+            table = self._translate_tables.get(charset)
+            if table is None:
+                table = self._translate_tables[charset] = charset.encode('ascii') * (256 // n)
+            mapped = self._randbytes(count * length).translate(table).decode('ascii')
+            return [mapped[i * length:(i + 1) * length] for i in range(count)]
+
+        # General charsets: draw every index at once and gather through a
+        # byte table, so the PRNG and the assembly both run in C
+        if NUMPY_AVAILABLE and count * length >= 1024:
+            table = self._charset_table(charset)
+            idx = self._rng.integers(0, n, size=count * length)
+            flat = table[idx].tobytes().decode('ascii')
+            return [flat[i * length:(i + 1) * length] for i in range(count)]
+
+        if count > 1:
+            # One batched draw covering every string, then fixed-width slices
+            flat = ''.join(self._pyrand.choices(charset, k=length * count))
+            return [flat[i * length:(i + 1) * length] for i in range(count)]
+
         for _ in range(count):
-            results.append(''.join(random.choices(charset, k=length)))
+            results.append(''.join(self._pyrand.choices(charset, k=length)))
 
         return results
 
@@ -128,46 +604,162 @@ class RandomGenerator:
             {s} - symbol
             {w} - word character (alphanumeric)
         """
-        results = []
-        replacements = {
-            'd': string.digits,
-            'l': string.ascii_lowercase,
-            'u': string.ascii_uppercase,
-            'a': string.ascii_letters,
-            'x': '0123456789abcdef',
-            's': string.punctuation,
-            'w': string.ascii_letters + string.digits
-        }
+        replacements = self._REPLACEMENTS
+
+        # Tokenize the template once: after the split, even indices are
+        # literal text and odd indices are placeholder keys, so each output
+        # is a single join instead of repeated substring searches
+        parts, kinds, slots, fills = self._compile_template(template)
+
+        # Nothing random to fill in: every output is the template itself
+        if not kinds:
+            return [template] * count
+
+        # A bare single placeholder (e.g. "{d}") is just a choices() draw
+        if len(parts) == 3 and not parts[0] and not parts[2]:
+            return self._pyrand.choices(replacements[kinds[0]], k=count)
+
+        # Very large batches: stamp the template into a (count, width)
+        # byte matrix — literals broadcast into their columns once, each
+        # placeholder column is one bulk integers() gather — then decode
+        # and slice. Placeholder charsets are ASCII, so only templates
+        # with non-ASCII literal text fall through
+        if NUMPY_AVAILABLE and count >= 1024:
+            try:
+                lit_bytes = [part.encode('ascii') for part in parts[::2]]
+            except UnicodeEncodeError:
+                lit_bytes = None
+            if lit_bytes is not None:
+                width = sum(len(b) for b in lit_bytes) + len(kinds)
+                out = np.empty((count, width), dtype=np.uint8)
+                col = 0
+                lit = iter(lit_bytes)
+                for j, part in enumerate(parts):
+                    if j % 2 == 0:
+                        b = next(lit)
+                        if b:
+                            out[:, col:col + len(b)] = np.frombuffer(b, dtype=np.uint8)
+                            col += len(b)
+                    else:
+                        table = np.frombuffer(
+                            ''.join(replacements[part]).encode('ascii'),
+                            dtype=np.uint8)
+                        idx = self._rng.integers(0, len(table), size=count)
+                        out[:, col] = table[idx]
+                        col += 1
+                flat = out.tobytes().decode('ascii')
+                return [flat[i * width:(i + 1) * width] for i in range(count)]
 
+        results = []
+        if count >= self._BATCH_THRESHOLD and kinds:
+            # Pre-draw every random character with one choices() call per
+            # placeholder kind instead of count * placeholders single draws
+            occ = {}
+            for k in kinds:
+                occ[k] = occ.get(k, 0) + 1
+            buffers = {k: iter(self._pyrand.choices(replacements[k], k=n * count))
+                       for k, n in occ.items()}
+            slot_buffers = [(i, buffers[k]) for i, k in zip(slots, kinds)]
+            for _ in range(count):
+                out = list(parts)
+                for i, buf in slot_buffers:
+                    out[i] = next(buf)
+                results.append(''.join(out))
+            return results
+
+        choice = self._pyrand.choice
+        slot_fills = list(zip(slots, fills))
         for _ in range(count):
-            result = template
-            for key, charset in replacements.items():
-                pattern = '{' + key + '}'
-                while pattern in result:
-                    result = result.replace(pattern, random.choice(charset), 1)
-            results.append(result)
+            out = list(parts)
+            for i, cs in slot_fills:
+                out[i] = choice(cs)
+            results.append(''.join(out))
 
         return results
 
     def generate_from_list(self, items: List[str], count: int = 1,
-                          unique: bool = False) -> List[str]:
-        """Generate random items from a list"""
+                          unique: bool = False,
+                          weights: Optional[List[float]] = None) -> List[str]:
+        """Generate random items from a list, optionally weighted"""
+        if weights is not None:
+            if len(weights) != len(items):
+                raise ValueError(f"Need {len(items)} weights, got {len(weights)}")
+            if unique:
+                raise ValueError("Weighted selection cannot be combined with unique")
+
+            key = tuple(weights)
+            table = self._alias_tables.get(key)
+            if table is None:
+                table = self._alias_tables[key] = _AliasTable(weights)
+            return [items[table.draw(self._pyrand)] for _ in range(count)]
+
         if unique:
             if count > len(items):
                 raise ValueError(f"Cannot select {count} unique items from {len(items)} items")
-            return random.sample(items, count)
-        return random.choices(items, k=count)
+
+            # Sparse unique selections draw index sets without touching the
+            # bulk of the list: NumPy's no-shuffle choice runs a partial
+            # Fisher-Yates in C
+            if (NUMPY_AVAILABLE and count >= self._BATCH_THRESHOLD
+                    and count * 20 < len(items)):
+                idx = self._rng.choice(len(items), size=count,
+                                       replace=False, shuffle=False)
+                return [items[i] for i in idx.tolist()]
+
+            # For tiny selections from huge lists, reject on indices instead
+            # of letting random.sample set up its selection machinery
+            if count * 100 < len(items):
+                picked = set()
+                out = []
+                while len(out) < count:
+                    i = self._pyrand.randrange(len(items))
+                    if i not in picked:
+                        picked.add(i)
+                        out.append(items[i])
+                return out
+
+            return self._pyrand.sample(items, count)
+
+        if NUMPY_AVAILABLE and count >= self._BATCH_THRESHOLD:
+            # Bulk index draw; items stay Python objects so only the
+            # random indices go through NumPy
+            idx = self._rng.integers(0, len(items), size=count).tolist()
+            return [items[i] for i in idx]
+        return self._pyrand.choices(items, k=count)
 
 
 class TUI:
     """Text User Interface for the generator"""
 
+    # Input parsers keyed by requested type; one lookup replaces the
+    # per-call type-comparison chain
+    _PARSERS = {
+        int: lambda value, default: int(value) if value else default,
+        float: lambda value, default: float(value) if value else default,
+    }
+
     def __init__(self):
         self.generator = RandomGenerator()
+        # Menu choice -> handler; run() dispatches through one lookup
+        self._dispatch = {
+            '1': self.generate_numbers_ui,
+            '2': self.generate_floats_ui,
+            '3': self.generate_colors_ui,
+            '4': self.generate_strings_ui,
+            '5': self.generate_custom_ui,
+            '6': self.generate_from_list_ui,
+        }
 
     def clear_screen(self):
         """Clear terminal screen"""
-        print("\n" * 50)
+        if not sys.stdout.isatty():
+            print("\n" * 50)
+        elif os.name == 'nt':
+            # Older Windows consoles don't handle ANSI escapes
+            os.system('cls')
+        else:
+            sys.stdout.write("\x1b[2J\x1b[H")
+            sys.stdout.flush()
 
     def display_menu(self):
         """Display main menu"""
@@ -195,10 +787,9 @@ class TUI:
         if not value and default is not None:
             return default
 
-        if input_type == int:
-            return int(value) if value else default
-        elif input_type == float:
-            return float(value) if value else default
+        parser = self._PARSERS.get(input_type)
+        if parser is not None:
+            return parser(value, default)
 
         return value
 
@@ -246,7 +837,7 @@ class TUI:
     def generate_strings_ui(self):
         """UI for string generation"""
         print("\n--- Generate Strings ---")
-        print("Patterns: alphanumeric, alpha, numeric, lowercase, uppercase, hex, symbols, alphanumeric_symbols")
+        print("Patterns: " + ", ".join(RandomGenerator._PATTERNS))
         length = self.get_input("String length", 10, int)
         pattern = self.get_input("Pattern", "alphanumeric")
         exclude_chars = self.get_input("Characters to exclude", "")
@@ -301,18 +892,10 @@ class TUI:
             if choice == '0':
                 print("\nGoodbye!")
                 break
-            elif choice == '1':
-                self.generate_numbers_ui()
-            elif choice == '2':
-                self.generate_floats_ui()
-            elif choice == '3':
-                self.generate_colors_ui()
-            elif choice == '4':
-                self.generate_strings_ui()
-            elif choice == '5':
-                self.generate_custom_ui()
-            elif choice == '6':
-                self.generate_from_list_ui()
+
+            handler = self._dispatch.get(choice)
+            if handler is not None:
+                handler()
             else:
                 print("\nInvalid option!")
 
@@ -323,7 +906,7 @@ class GUI:
     """Graphical User Interface for the generator"""
 
     def __init__(self):
-        if not GUI_AVAILABLE:
+        if not _import_tkinter():
             print("Error: tkinter not available. GUI mode requires tkinter.")
             sys.exit(1)
 
@@ -343,7 +926,19 @@ class GUI:
         self.wheel_spinning = False
         self.wheel_speed = 0
         self.selected_item = None
-        self.wheel_segments = []  # Store segment positions for winner detection
+        self._parse_cache = {}  # widget id -> (raw text, parsed value)
+        self._insert_job = None  # pending after_idle id for chunked inserts
+        self._insert_text = ''
+        self._insert_pos = 0
+        self._last_results_str = ''
+        self._angle_per_item = 0
+        self._last_drawn_angle = 0
+        self._base_starts = []
+        self._segment_colors = []
+        self._wheel_geom = None  # (width, height) the canvas items were built for
+        self._segment_ids = []
+        self._text_ids = []
+        self._highlight_id = None
 
         self.setup_ui()
 
@@ -399,11 +994,27 @@ class GUI:
                            value=value, command=self.on_type_change).grid(
                 row=0, column=i, padx=5)
 
-        # Options Frame (will change based on type)
-        self.options_frame = ttk.LabelFrame(main_frame, text="Options", padding="10")
-        self.options_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E),
-                               pady=10)
-        self.options_frame.columnconfigure(1, weight=1)
+        # Options frames: one per generation type, built once up front and
+        # swapped with grid/grid_remove instead of destroyed and rebuilt,
+        # which avoids a burst of Tcl widget churn on every type change
+        self._option_frames = {}
+        self._current_frame = None
+        for gen_type, builder in [
+            ("number", self.setup_number_options),
+            ("float", self.setup_float_options),
+            ("color", self.setup_color_options),
+            ("string", self.setup_string_options),
+            ("custom", self.setup_custom_options),
+            ("list", self.setup_list_options),
+        ]:
+            frame = ttk.LabelFrame(main_frame, text="Options", padding="10")
+            frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E),
+                       pady=10)
+            frame.columnconfigure(1, weight=1)
+            frame.grid_remove()
+            self._option_frames[gen_type] = frame
+            self.options_frame = frame  # builders target the current frame
+            builder()
 
         # Results Frame
         results_frame = ttk.LabelFrame(main_frame, text="Results", padding="10")
@@ -506,16 +1117,52 @@ class GUI:
         self.wheel_items = items
         self.wheel_angle = 0
         self.selected_item = None
+        self._precompute_wheel_layout()
+        self._wheel_geom = None  # force a canvas rebuild for the new items
         self.wheel_result_label.config(text="Ready to spin!")
         self.draw_wheel()
 
+    # Segment palette; fixed, so per-item colors can be resolved once per
+    # item-list change instead of per frame
+    _WHEEL_COLORS = [
+        '#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8',
+        '#F7DC6F', '#BB8FCE', '#85C1E2', '#F8B739', '#52BE80',
+        '#EC7063', '#5DADE2', '#F4D03F', '#AF7AC5', '#48C9B0',
+        '#EB984E', '#7FB3D5', '#82E0AA', '#F5B7B1', '#AED6F1'
+    ]
+
+    def _precompute_wheel_layout(self):
+        """Precompute per-item angles and colors for the animation loop.
+
+        draw_wheel runs every ~16 ms while spinning; only the rotation
+        changes between frames, so everything that depends purely on the
+        item list is computed here once.
+        """
+        num_items = len(self.wheel_items)
+        angle_per_item = 360 / num_items
+        self._angle_per_item = angle_per_item
+        # Segment 0 is centered at the top (90 degrees) before rotation
+        self._base_starts = [90 - angle_per_item / 2 - i * angle_per_item
+                             for i in range(num_items)]
+        # cos/sin of each segment's mid angle: with the angle-addition
+        # identity the frame loop rotates all labels from one cos/sin of
+        # the current wheel angle instead of per-segment trig calls
+        mids = [math.radians(start + angle_per_item / 2)
+                for start in self._base_starts]
+        self._mid_cos = [math.cos(m) for m in mids]
+        self._mid_sin = [math.sin(m) for m in mids]
+        self._segment_colors = [self._WHEEL_COLORS[i % len(self._WHEEL_COLORS)]
+                                for i in range(num_items)]
+        # Truncate long labels once per item list, not per rebuild
+        self._display_items = [item if len(item) <= 12 else item[:10] + '..'
+                               for item in self.wheel_items]
+
     def draw_wheel(self):
         """Draw the wheel of fortune"""
         if not self.wheel_items:
             return
 
         canvas = self.wheel_canvas
-        canvas.delete('all')
 
         # Get canvas dimensions
         width = canvas.winfo_width()
@@ -525,67 +1172,83 @@ class GUI:
             self.root.after(100, self.draw_wheel)
             return
 
-        # Calculate center and radius
+        # Canvas items are created once per item list / canvas size and
+        # then mutated in place: recreating ~20 arcs and labels per frame
+        # is what used to dominate the animation loop
+        if self._wheel_geom != (width, height):
+            self._build_wheel(width, height)
+
         center_x = width / 2
         center_y = height / 2
         radius = min(width, height) / 2 - 40
+        angle_per_item = self._angle_per_item
+        text_radius = radius * 0.65
 
-        # Colors for wheel segments
-        colors = [
-            '#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8',
-            '#F7DC6F', '#BB8FCE', '#85C1E2', '#F8B739', '#52BE80',
-            '#EC7063', '#5DADE2', '#F4D03F', '#AF7AC5', '#48C9B0',
-            '#EB984E', '#7FB3D5', '#82E0AA', '#F5B7B1', '#AED6F1'
-        ]
+        # One cos/sin for the rotation; per-segment values come from the
+        # precomputed mid-angle tables via cos(a+b)/sin(a+b)
+        rot = math.radians(self.wheel_angle)
+        cos_r, sin_r = math.cos(rot), math.sin(rot)
 
-        # Draw segments
-        num_items = len(self.wheel_items)
-        angle_per_item = 360 / num_items
+        for i in range(len(self.wheel_items)):
+            # Rotate the precomputed base angle by the current wheel angle
+            start_angle = self._base_starts[i] + self.wheel_angle
 
-        # Store segments for winner calculation
-        self.wheel_segments = []
+            canvas.itemconfig(self._segment_ids[i], start=start_angle)
 
-        for i, item in enumerate(self.wheel_items):
-            # Start angle for this segment
-            # We want segment 0 centered at top (90 degrees)
-            # So segment 0 starts at: 90 - (angle_per_item/2)
-            # And rotates by wheel_angle
-            start_angle = 90 - (angle_per_item / 2) - (i * angle_per_item) + self.wheel_angle
+            # Text follows the middle of its segment (no rotation - keep
+            # it readable)
+            cos_m = self._mid_cos[i] * cos_r - self._mid_sin[i] * sin_r
+            sin_m = self._mid_sin[i] * cos_r + self._mid_cos[i] * sin_r
+            canvas.coords(self._text_ids[i],
+                          center_x + text_radius * cos_m,
+                          center_y - text_radius * sin_m)
 
-            color = colors[i % len(colors)]
+        # The clickable-button highlight only shows while idle
+        canvas.itemconfig(self._highlight_id,
+                          state='hidden' if self.wheel_spinning else 'normal')
 
-            # Store segment info for winner detection
-            self.wheel_segments.append({
-                'item': item,
-                'start': start_angle % 360,
-                'end': (start_angle + angle_per_item) % 360,
-                'index': i
-            })
+    def _build_wheel(self, width, height):
+        """Create every canvas item for the current items and canvas size.
+
+        The animation loop never recreates these; it only adjusts arc start
+        angles and text positions via itemconfig/coords.
+        """
+        canvas = self.wheel_canvas
+        canvas.delete('all')
+
+        # Calculate center and radius
+        center_x = width / 2
+        center_y = height / 2
+        radius = min(width, height) / 2 - 40
+
+        angle_per_item = self._angle_per_item
+        text_radius = radius * 0.65
+
+        self._segment_ids = []
+        self._text_ids = []
+
+        for i in range(len(self.wheel_items)):
+            start_angle = self._base_starts[i] + self.wheel_angle
 
             # Draw segment
-            canvas.create_arc(
+            self._segment_ids.append(canvas.create_arc(
                 center_x - radius, center_y - radius,
                 center_x + radius, center_y + radius,
                 start=start_angle, extent=angle_per_item,
-                fill=color, outline='white', width=3
-            )
+                fill=self._segment_colors[i], outline='white', width=3
+            ))
 
             # Calculate text position - middle of segment
             mid_angle = math.radians(start_angle + angle_per_item / 2)
-            text_radius = radius * 0.65
             text_x = center_x + text_radius * math.cos(mid_angle)
             text_y = center_y - text_radius * math.sin(mid_angle)
 
-            # Truncate long text
-            display_text = item if len(item) <= 12 else item[:10] + '..'
-
-            # Draw text (no rotation - keep it readable)
-            canvas.create_text(
+            self._text_ids.append(canvas.create_text(
                 text_x, text_y,
-                text=display_text,
+                text=self._display_items[i],
                 font=('Arial', 9, 'bold'),
                 fill='white'
-            )
+            ))
 
         # Draw outer circle border
         canvas.create_oval(
@@ -613,14 +1276,12 @@ class GUI:
             fill='white'
         )
 
-        # Add visual feedback - make it look like a button
-        if not self.wheel_spinning:
-            # Draw highlight to make it look clickable
-            canvas.create_oval(
-                center_x - center_radius + 3, center_y - center_radius + 3,
-                center_x + center_radius - 3, center_y + center_radius - 3,
-                outline='#E74C3C', width=2, dash=(5, 3)
-            )
+        # Clickable-button highlight; toggled via item state, not recreated
+        self._highlight_id = canvas.create_oval(
+            center_x - center_radius + 3, center_y - center_radius + 3,
+            center_x + center_radius - 3, center_y + center_radius - 3,
+            outline='#E74C3C', width=2, dash=(5, 3)
+        )
 
         # Draw pointer (triangle at top) - pointing DOWN into wheel
         pointer_size = 25
@@ -639,6 +1300,8 @@ class GUI:
             fill='#34495E', outline='white', width=2
         )
 
+        self._wheel_geom = (width, height)
+
     def on_wheel_click(self, event):
         """Handle click on canvas - check if center button was clicked"""
         if self.center_button_coords is None or self.wheel_spinning:
@@ -676,8 +1339,14 @@ class GUI:
             # Decrease speed (friction)
             self.wheel_speed *= 0.97
 
-            # Redraw
-            self.draw_wheel()
+            # Skip the redraw while the rim would move by less than a
+            # pixel: the friction tail spends most of its frames on
+            # rotations nobody can see
+            radius = (min(self._wheel_geom) / 2 - 40) if self._wheel_geom else 200
+            delta = abs(self.wheel_angle - self._last_drawn_angle) % 360
+            if radius * math.radians(min(delta, 360 - delta)) >= 1.0:
+                self._last_drawn_angle = self.wheel_angle
+                self.draw_wheel()
 
             # Continue animation
             self.root.after(16, self.animate_wheel)  # ~60 FPS
@@ -686,29 +1355,18 @@ class GUI:
             self.wheel_spinning = False
             self.wheel_speed = 0
 
-            # Find which segment the pointer (at 90 degrees) is pointing to
-            pointer_angle = 90
-
-            winner_item = None
-            for segment in self.wheel_segments:
-                start = segment['start']
-                end = segment['end']
-
-                # Handle wrap-around (when segment crosses 0 degrees)
-                if start > end:
-                    if pointer_angle >= start or pointer_angle <= end:
-                        winner_item = segment['item']
-                        break
-                else:
-                    if start <= pointer_angle <= end:
-                        winner_item = segment['item']
-                        break
+            # Land the final frame (the tail above may have skipped it)
+            self._last_drawn_angle = self.wheel_angle
+            self.draw_wheel()
 
-            # Fallback if something went wrong
-            if winner_item is None:
-                winner_item = self.wheel_items[0]
+            # Segment i is centered at the top pointer when the rotation
+            # is i * angle_per_item, so the winner falls out of one
+            # division instead of a wrap-around scan over segment bounds
+            angle_per_item = self._angle_per_item
+            index = int(((self.wheel_angle % 360) + angle_per_item / 2)
+                        // angle_per_item) % len(self.wheel_items)
 
-            self.selected_item = winner_item
+            self.selected_item = self.wheel_items[index]
             self.wheel_result_label.config(
                 text=f"🎉 Winner: {self.selected_item}",
                 foreground='#27AE60'
@@ -727,28 +1385,17 @@ class GUI:
         else:
             self.wheel_result_label.config(foreground='#27AE60')
 
-    def clear_options_frame(self):
-        """Clear all widgets from options frame"""
-        for widget in self.options_frame.winfo_children():
-            widget.destroy()
-
     def on_type_change(self):
-        """Handle generation type change"""
-        self.clear_options_frame()
-        gen_type = self.gen_type.get()
-
-        if gen_type == "number":
-            self.setup_number_options()
-        elif gen_type == "float":
-            self.setup_float_options()
-        elif gen_type == "color":
-            self.setup_color_options()
-        elif gen_type == "string":
-            self.setup_string_options()
-        elif gen_type == "custom":
-            self.setup_custom_options()
-        elif gen_type == "list":
-            self.setup_list_options()
+        """Swap in the prebuilt options frame for the selected type"""
+        frame = self._option_frames[self.gen_type.get()]
+        if frame is self._current_frame:
+            return
+
+        if self._current_frame is not None:
+            self._current_frame.grid_remove()
+        self._current_frame = frame
+        self.options_frame = frame
+        frame.grid()
 
     def setup_number_options(self):
         """Setup options for number generation"""
@@ -815,8 +1462,7 @@ class GUI:
         self.str_length.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
 
         ttk.Label(self.options_frame, text="Pattern:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        patterns = ["alphanumeric", "alpha", "numeric", "lowercase", "uppercase",
-                   "hex", "symbols", "alphanumeric_symbols"]
+        patterns = list(RandomGenerator._PATTERNS)
         self.str_pattern = ttk.Combobox(self.options_frame, values=patterns,
                                         width=20, state="readonly")
         self.str_pattern.set("alphanumeric")
@@ -868,6 +1514,20 @@ class GUI:
                        variable=self.list_unique).grid(row=2, column=0, columnspan=2,
                                                        sticky=tk.W, pady=5)
 
+    def _cached_parse(self, widget, parse):
+        """Parse an Entry's text, reusing the last result if unchanged.
+
+        Repeated Generate clicks with untouched settings skip the O(n)
+        split/convert work for comma-separated fields.
+        """
+        text = widget.get()
+        cached = self._parse_cache.get(id(widget))
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        value = parse(text)
+        self._parse_cache[id(widget)] = (text, value)
+        return value
+
     def generate(self):
         """Generate values based on current settings"""
         try:
@@ -878,10 +1538,10 @@ class GUI:
                 min_val = int(self.num_min.get())
                 max_val = int(self.num_max.get())
                 count = int(self.num_count.get())
-                exclude_str = self.num_exclude.get().strip()
-                exclude = set()
-                if exclude_str:
-                    exclude = {int(x.strip()) for x in exclude_str.split(',')}
+                exclude = self._cached_parse(
+                    self.num_exclude,
+                    lambda text: {int(x.strip()) for x in text.split(',')}
+                    if text.strip() else set())
                 results = self.generator.generate_number(min_val, max_val, exclude, count)
 
             elif gen_type == "float":
@@ -909,27 +1569,70 @@ class GUI:
                 results = self.generator.generate_custom(template, count)
 
             elif gen_type == "list":
-                items_str = self.list_items.get()
-                items = [x.strip() for x in items_str.split(',')]
+                items = self._cached_parse(
+                    self.list_items,
+                    lambda text: [x.strip() for x in text.split(',')])
                 count = int(self.list_count.get())
                 unique = self.list_unique.get()
                 results = self.generator.generate_from_list(items, count, unique)
 
-            # Display results
+            # Display results: one insert per batch, not per row — every
+            # insert is a separate Python-to-Tcl round trip
+            self._cancel_pending_insert()
             self.results_text.delete(1.0, tk.END)
-            for result in results:
-                self.results_text.insert(tk.END, f"{result}\n")
+            if len(results) == 1:
+                # Repeated single-value clicks skip the join machinery
+                self._last_results_str = str(results[0])
+                self.results_text.insert(tk.END, f"{results[0]}\n")
+            else:
+                # color/string/custom/list results are already strings;
+                # only number/float batches need the str() pass
+                if isinstance(results[0], str):
+                    text = '\n'.join(results) + '\n'
+                else:
+                    text = '\n'.join(map(str, results)) + '\n'
+                self._last_results_str = text[:-1]
+                if len(text) <= 65536:
+                    self.results_text.insert(tk.END, text)
+                else:
+                    # Huge batches stream in 64KB slices between event-loop
+                    # turns so the window stays responsive while filling
+                    self._insert_text = text
+                    self._insert_pos = 0
+                    self._flush_insert_chunk()
 
         except Exception as e:
             messagebox.showerror("Error", f"Generation failed: {str(e)}")
 
+    def _cancel_pending_insert(self):
+        """Drop any chunked insert still streaming into the results box"""
+        if self._insert_job is not None:
+            self.root.after_cancel(self._insert_job)
+            self._insert_job = None
+        self._insert_text = ''
+
+    def _flush_insert_chunk(self):
+        """Insert the next 64KB slice and reschedule until drained"""
+        pos = self._insert_pos
+        self.results_text.insert(tk.END, self._insert_text[pos:pos + 65536])
+        self._insert_pos = pos + 65536
+        if self._insert_pos < len(self._insert_text):
+            self._insert_job = self.root.after_idle(self._flush_insert_chunk)
+        else:
+            self._insert_job = None
+            self._insert_text = ''
+
     def clear_results(self):
         """Clear the results text area"""
+        self._cancel_pending_insert()
+        self._last_results_str = ''
         self.results_text.delete(1.0, tk.END)
 
     def copy_to_clipboard(self):
         """Copy results to clipboard"""
-        results = self.results_text.get(1.0, tk.END).strip()
+        # The last batch is kept in Python, so copying skips pulling the
+        # whole buffer back across the Tcl boundary
+        results = self._last_results_str or self.results_text.get(1.0, tk.END).strip()
         if results:
             self.root.clipboard_clear()
             self.root.clipboard_append(results)
@@ -942,10 +1645,87 @@ class GUI:
         self.root.mainloop()
 
 
+def _run_repl(generator: RandomGenerator) -> None:
+    """Serve generation commands from stdin on one warm process.
+
+    Each line is '<mode> [args...]':
+        number MIN MAX [COUNT [EXCLUDE]]
+        float MIN MAX [DECIMALS [COUNT]]
+        color [FORMAT [COUNT]]
+        string [LENGTH [PATTERN [COUNT [EXCLUDE_CHARS]]]]
+        custom TEMPLATE [COUNT]
+        list ITEM,ITEM,... [COUNT]
+
+    One result per line; malformed input reports an error and keeps the
+    loop alive. Amortizes interpreter startup, imports, and any JIT
+    compilation across every request in the session.
+    """
+    import shlex
+
+    def _number(t):
+        exclude = frozenset(map(int, t[3].split(','))) if len(t) > 3 else frozenset()
+        count = int(t[2]) if len(t) > 2 else 1
+        return generator.generate_number(int(t[0]), int(t[1]), exclude, count)
+
+    def _float(t):
+        decimals = int(t[2]) if len(t) > 2 else 2
+        count = int(t[3]) if len(t) > 3 else 1
+        return generator.generate_float(float(t[0]), float(t[1]), decimals, count)
+
+    def _color(t):
+        return generator.generate_color(t[0] if t else 'hex',
+                                        int(t[1]) if len(t) > 1 else 1)
+
+    def _string(t):
+        length = int(t[0]) if t else 10
+        pattern = t[1] if len(t) > 1 else 'alphanumeric'
+        count = int(t[2]) if len(t) > 2 else 1
+        exclude_chars = t[3] if len(t) > 3 else ''
+        return generator.generate_string(length, pattern, exclude_chars, count)
+
+    def _custom(t):
+        return generator.generate_custom(t[0], int(t[1]) if len(t) > 1 else 1)
+
+    def _list(t):
+        items = [x.strip() for x in t[0].split(',')]
+        return generator.generate_from_list(items, int(t[1]) if len(t) > 1 else 1)
+
+    dispatch = {'number': _number, 'float': _float, 'color': _color,
+                'string': _string, 'custom': _custom, 'list': _list}
+
+    for line in sys.stdin:
+        try:
+            tokens = shlex.split(line)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            continue
+        if not tokens:
+            continue
+        if tokens[0] in ('quit', 'exit'):
+            break
+        handler = dispatch.get(tokens[0])
+        if handler is None:
+            print(f"Error: unknown command '{tokens[0]}'", file=sys.stderr)
+            continue
+        try:
+            print('\n'.join(map(str, handler(tokens[1:]))), flush=True)
+        except (ValueError, IndexError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+
+
 def main():
     """Main entry point"""
+    # Bare invocation goes straight to the TUI: no arguments to parse, so
+    # skip building the parser (and importing argparse) entirely
+    if len(sys.argv) == 1:
+        tui = TUI()
+        tui.run()
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(description='Advanced Random Value Generator')
-    parser.add_argument('--mode', choices=['tui', 'gui', 'number', 'float', 'color', 'string', 'custom', 'list'],
+    parser.add_argument('--mode', choices=['tui', 'gui', 'repl', 'number', 'float', 'color', 'string', 'custom', 'list'],
                        help='Generation mode')
 
     # Number options
@@ -963,9 +1743,7 @@ def main():
 
     # String options
     parser.add_argument('--length', type=int, default=10, help='String length')
-    parser.add_argument('--pattern',
-                       choices=['alphanumeric', 'alpha', 'numeric', 'lowercase', 'uppercase',
-                               'hex', 'symbols', 'alphanumeric_symbols'],
+    parser.add_argument('--pattern', choices=list(RandomGenerator._PATTERNS),
                        default='alphanumeric', help='String pattern')
     parser.add_argument('--exclude-chars', type=str, default='', help='Characters to exclude from string')
 
@@ -975,11 +1753,10 @@ def main():
     # List options
     parser.add_argument('--items', type=str, help='Comma-separated list of items')
     parser.add_argument('--unique', action='store_true', help='Select unique items only')
+    parser.add_argument('--weights', type=str, help='Comma-separated weights for list items')
 
     args = parser.parse_args()
 
-    generator = RandomGenerator()
-
     # GUI mode
     if args.mode == 'gui':
         gui = GUI()
@@ -992,39 +1769,72 @@ def main():
         tui.run()
         return
 
-    # Command-line mode
+    # Command-line mode; GUI/TUI build their own generator, so only the
+    # CLI branches pay for this one
+    generator = RandomGenerator()
+
+    # REPL: many generations per process, paying startup costs once
+    if args.mode == 'repl':
+        _run_repl(generator)
+        return
+
     try:
+        batch = None  # set for modes whose draws are independent
+
         if args.mode == 'number':
-            exclude = set()
+            # int() tolerates surrounding whitespace, so no per-token strip;
+            # frozenset gives the cheapest possible membership tests downstream
+            exclude = frozenset()
             if args.exclude:
-                exclude = {int(x.strip()) for x in args.exclude.split(',')}
+                exclude = frozenset(map(int, args.exclude.split(',')))
+            # numbers are unique across the whole run, so no chunking
             results = generator.generate_number(int(args.min), int(args.max), exclude, args.count)
 
         elif args.mode == 'float':
-            results = generator.generate_float(args.min, args.max, args.decimals, args.count)
+            batch = lambda n: generator.generate_float(args.min, args.max, args.decimals, n)
 
         elif args.mode == 'color':
-            results = generator.generate_color(args.format, args.count)
+            batch = lambda n: generator.generate_color(args.format, n)
 
         elif args.mode == 'string':
-            results = generator.generate_string(args.length, args.pattern, args.exclude_chars, args.count)
+            batch = lambda n: generator.generate_string(args.length, args.pattern, args.exclude_chars, n)
 
         elif args.mode == 'custom':
             if not args.template:
                 print("Error: --template required for custom mode")
                 return
-            results = generator.generate_custom(args.template, args.count)
+            batch = lambda n: generator.generate_custom(args.template, n)
 
         elif args.mode == 'list':
             if not args.items:
                 print("Error: --items required for list mode")
                 return
             items = [x.strip() for x in args.items.split(',')]
-            results = generator.generate_from_list(items, args.count, args.unique)
-
-        # Print results
-        for result in results:
-            print(result)
+            weights = None
+            if args.weights:
+                weights = list(map(float, args.weights.split(',')))
+            if args.unique:
+                # unique selection spans the whole count, so no chunking
+                results = generator.generate_from_list(items, args.count, True, weights)
+            else:
+                batch = lambda n: generator.generate_from_list(items, n, False, weights)
+
+        if batch is not None:
+            # Generate and print in chunks: memory stays flat for huge counts
+            # and output overlaps generation
+            remaining = args.count
+            write = sys.stdout.write
+            while remaining > 0:
+                n = min(remaining, 4096)
+                chunk = batch(n)
+                # every mode here except float already yields strings
+                if not isinstance(chunk[0], str):
+                    chunk = map(str, chunk)
+                write('\n'.join(chunk) + '\n')
+                remaining -= n
+        else:
+            for result in results:
+                print(result)
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)